@@ -8,28 +8,78 @@ through completion with minimal user intervention.
 
 Usage:
     python3 autonomous_project.py "Build a todo app with React and local storage"
-    python3 autonomous_project.py --resume <session_id>
+    python3 autonomous_project.py resume <session_id>
+
+The original "--resume <session_id>" form is still accepted.
 """
 
 import json
 import sys
 import sqlite3
-import time
-import subprocess
-import webbrowser
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import argparse
 import atexit
+import threading
+from contextlib import contextmanager, nullcontext
+
+from project_db import ConnectionPool, _configure_connection, create_schema
+
+# orjson is optional; when present it encodes/decodes task lists several
+# times faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> str:
+    """Compact JSON encoding for values stored in the database"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _json_loads(data: str) -> Any:
+    """Decode JSON, raising json.JSONDecodeError on bad input either way"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-# Import task synchronization
+# zstandard is optional; without it reports are always stored as plain JSON
 try:
-    from task_sync import TaskSync, init_sync
+    import zstandard
 except ImportError:
-    print("⚠️  task_sync.py not found. Task synchronization disabled.")
-    TaskSync = None
-    init_sync = None
+    zstandard = None
+
+# Reports at or below this many bytes of JSON are not worth compressing
+REPORT_COMPRESS_THRESHOLD = 1024
+
+
+def encode_report_data(report: Dict[str, Any]) -> tuple:
+    """Serialise a report into (data, data_z, compressed) column values
+
+    Large payloads are zstd-compressed into data_z when that saves at least
+    10%; everything else is stored as JSON text in data.
+    """
+    raw = _json_dumps(report)
+    if zstandard is not None and len(raw) > REPORT_COMPRESS_THRESHOLD:
+        encoded = raw.encode()
+        blob = zstandard.ZstdCompressor(level=3).compress(encoded)
+        if len(blob) < len(encoded) * 0.9:
+            return None, blob, 1
+    return raw, None, 0
+
+
+def decode_report_data(data: Optional[str], data_z: Optional[bytes], compressed: int) -> Dict[str, Any]:
+    """Inverse of encode_report_data"""
+    if compressed:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read compressed reports (pip install zstandard)")
+        data = zstandard.ZstdDecompressor().decompress(data_z)
+    return _json_loads(data)
+
 
 # Agent role definitions
 AGENT_ROLES = {
@@ -97,6 +147,63 @@ AGENT_ROLES = {
     }
 }
 
+# Project phases and the phases each one waits for; everything after
+# implementation only needs the build to have started, so those run together
+PHASE_DEPENDENCIES = {
+    "planning": (),
+    "implementation": ("planning",),
+    "quality_check": ("implementation",),
+    "testing": ("implementation",),
+    "documentation": ("implementation",),
+}
+
+# Statements are kept as constants so every call passes the identical
+# string and hits the connection's prepared-statement cache
+SQL_INSERT_SESSION = """
+    INSERT INTO sessions (session_id, created_at, project_goal)
+    VALUES (?, ?, ?)
+"""
+SQL_INSERT_AGENT = """
+    INSERT INTO agents (session_id, role, agent_id, started_at)
+    VALUES (?, ?, ?, ?)
+"""
+SQL_INSERT_TASK = """
+    INSERT INTO tasks (session_id, task_id, agent_role, description, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+SQL_INSERT_TASK_IF_NEW = """
+    INSERT OR IGNORE INTO tasks (session_id, task_id, agent_role, description, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+SQL_UPDATE_TASK_STATUS = """
+    UPDATE tasks
+    SET status = ?, completed_at = COALESCE(?, completed_at)
+    WHERE task_id = ? AND session_id = ?
+"""
+SQL_INSERT_REPORT = """
+    INSERT INTO reports (session_id, timestamp, phase, completed_tasks, data, data_z, compressed)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_UPDATE_PHASE = """
+    UPDATE sessions
+    SET current_phase = ?
+    WHERE session_id = ?
+"""
+SQL_GET_SESSION_INFO = """
+    SELECT project_goal, current_phase, created_at
+    FROM sessions
+    WHERE session_id = ?
+"""
+SQL_COUNT_COMPLETED_TASKS = """
+    SELECT COUNT(*) FROM tasks
+    WHERE session_id = ? AND status = 'completed'
+"""
+SQL_GET_ACTIVE_AGENTS = """
+    SELECT DISTINCT role FROM agents
+    WHERE session_id = ? AND status = 'active'
+"""
+
+
 class ProjectState:
     """Manages persistent project state using SQLite"""
 
@@ -104,152 +211,141 @@ class ProjectState:
         self.project_dir = project_dir
         self.db_path = project_dir / ".autonomous_project.db"
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._tx_cursor = None
+        self._tx_timestamp = None
         self._init_database()
 
+        # Long-lived connections shared by all methods
+        self.pool = ConnectionPool(self.db_path)
+        atexit.register(self.close)
+
     def _init_database(self):
         """Initialize SQLite database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Sessions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sessions (
-                session_id TEXT PRIMARY KEY,
-                created_at TEXT NOT NULL,
-                project_goal TEXT NOT NULL,
-                current_phase TEXT DEFAULT 'initialization'
-            )
-        """)
-
-        # Agents table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS agents (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                role TEXT NOT NULL,
-                agent_id TEXT,
-                started_at TEXT NOT NULL,
-                status TEXT DEFAULT 'active',
-                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-            )
-        """)
-
-        # Tasks table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                task_id TEXT NOT NULL,
-                agent_role TEXT,
-                description TEXT,
-                status TEXT DEFAULT 'pending',
-                created_at TEXT NOT NULL,
-                completed_at TEXT,
-                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-            )
-        """)
-
-        # Reports table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS reports (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                phase TEXT,
-                completed_tasks INTEGER,
-                data TEXT,
-                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-            )
-        """)
-
+        conn = _configure_connection(sqlite3.connect(self.db_path))
+        create_schema(conn)
         conn.commit()
         conn.close()
 
-    def create_session(self, project_goal: str):
+    @contextmanager
+    def transaction(self):
+        """Group several writes into a single commit
+
+        Yields a cursor; every write made through it is committed together
+        when the block exits, or rolled back if it raises. Nested calls join
+        the outer transaction instead of opening a new one.
+        """
+        with self.pool.acquire_write() as conn:
+            if self._tx_cursor is not None:
+                yield self._tx_cursor
+                return
+
+            cursor = conn.cursor()
+            # Take the write lock up front so a concurrent reader can't force
+            # a lock upgrade to fail halfway through the transaction
+            cursor.execute("BEGIN IMMEDIATE")
+            self._tx_cursor = cursor
+            # Rows written in one transaction share a single timestamp
+            self._tx_timestamp = datetime.now().isoformat()
+            try:
+                yield cursor
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            finally:
+                self._tx_cursor = None
+                self._tx_timestamp = None
+
+    def _write_cursor(self, cursor: Optional[sqlite3.Cursor] = None):
+        """Use the caller's cursor, or run in a transaction of our own"""
+        return nullcontext(cursor) if cursor is not None else self.transaction()
+
+    def _timestamp(self, ts: Optional[str] = None) -> str:
+        """Caller's timestamp, else the open transaction's, else now"""
+        return ts or self._tx_timestamp or datetime.now().isoformat()
+
+    def close(self):
+        """Close the shared connections"""
+        self.pool.close()
+
+    def create_session(self, project_goal: str, cursor: Optional[sqlite3.Cursor] = None,
+                       ts: Optional[str] = None):
         """Create a new project session"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO sessions (session_id, created_at, project_goal)
-            VALUES (?, ?, ?)
-        """, (self.session_id, datetime.now().isoformat(), project_goal))
-        conn.commit()
-        conn.close()
+        with self._write_cursor(cursor) as cur:
+            cur.execute(SQL_INSERT_SESSION, (self.session_id, self._timestamp(ts), project_goal))
 
-    def add_agent(self, role: str, agent_id: str = None):
+    def add_agent(self, role: str, agent_id: str = None, cursor: Optional[sqlite3.Cursor] = None,
+                  ts: Optional[str] = None):
         """Register a new active agent"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO agents (session_id, role, agent_id, started_at)
-            VALUES (?, ?, ?, ?)
-        """, (self.session_id, role, agent_id, datetime.now().isoformat()))
-        conn.commit()
-        conn.close()
+        with self._write_cursor(cursor) as cur:
+            cur.execute(SQL_INSERT_AGENT, (self.session_id, role, agent_id, self._timestamp(ts)))
 
-    def add_task(self, task_id: str, agent_role: str = None, description: str = None):
+    def add_task(self, task_id: str, agent_role: str = None, description: str = None,
+                 cursor: Optional[sqlite3.Cursor] = None, ts: Optional[str] = None):
         """Add a new task"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO tasks (session_id, task_id, agent_role, description, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (self.session_id, task_id, agent_role, description, datetime.now().isoformat()))
-        conn.commit()
-        conn.close()
+        with self._write_cursor(cursor) as cur:
+            cur.execute(SQL_INSERT_TASK, (
+                self.session_id, task_id, agent_role, description, self._timestamp(ts)
+            ))
 
-    def complete_task(self, task_id: str):
-        """Mark a task as completed"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE tasks
-            SET status = 'completed', completed_at = ?
-            WHERE task_id = ? AND session_id = ?
-        """, (datetime.now().isoformat(), task_id, self.session_id))
-        conn.commit()
-        conn.close()
+    def add_tasks(self, tasks: List[tuple], cursor: Optional[sqlite3.Cursor] = None,
+                  ts: Optional[str] = None) -> int:
+        """Add many tasks at once from (task_id, agent_role, description) tuples
 
-    def add_report(self, report: Dict[str, Any]):
+        Tasks whose id already exists in this session are skipped. Returns the
+        number of tasks actually inserted.
+        """
+        with self._write_cursor(cursor) as cur:
+            now = self._timestamp(ts)
+            cur.executemany(SQL_INSERT_TASK_IF_NEW, [
+                (self.session_id, task_id, agent_role, description, now)
+                for task_id, agent_role, description in tasks
+            ])
+            return cur.rowcount
+
+    def complete_task(self, task_id: str, cursor: Optional[sqlite3.Cursor] = None,
+                      ts: Optional[str] = None):
+        """Mark a task as completed"""
+        self.set_task_status(task_id, "completed", cursor=cursor, ts=ts)
+
+    def set_task_status(self, task_id: str, status: str, cursor: Optional[sqlite3.Cursor] = None,
+                        ts: Optional[str] = None):
+        """Update a task's status, stamping completed_at when it completes"""
+        with self._write_cursor(cursor) as cur:
+            completed_at = self._timestamp(ts) if status == "completed" else None
+            cur.execute(SQL_UPDATE_TASK_STATUS, (status, completed_at, task_id, self.session_id))
+
+    def set_task_statuses(self, updates: List[tuple], cursor: Optional[sqlite3.Cursor] = None,
+                          ts: Optional[str] = None):
+        """Update many task statuses at once from (task_id, status) tuples"""
+        with self._write_cursor(cursor) as cur:
+            now = self._timestamp(ts)
+            cur.executemany(SQL_UPDATE_TASK_STATUS, [
+                (status, now if status == "completed" else None, task_id, self.session_id)
+                for task_id, status in updates
+            ])
+
+    def add_report(self, report: Dict[str, Any], cursor: Optional[sqlite3.Cursor] = None,
+                   ts: Optional[str] = None):
         """Add a progress report"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO reports (session_id, timestamp, phase, completed_tasks, data)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            self.session_id,
-            datetime.now().isoformat(),
-            report.get('phase'),
-            report.get('completed_tasks', 0),
-            json.dumps(report)
-        ))
-        conn.commit()
-        conn.close()
-
-    def set_phase(self, phase: str):
+        with self._write_cursor(cursor) as cur:
+            cur.execute(SQL_INSERT_REPORT, (
+                self.session_id,
+                self._timestamp(ts),
+                report.get('phase'),
+                report.get('completed_tasks', 0),
+                *encode_report_data(report)
+            ))
+
+    def set_phase(self, phase: str, cursor: Optional[sqlite3.Cursor] = None):
         """Update current project phase"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE sessions
-            SET current_phase = ?
-            WHERE session_id = ?
-        """, (phase, self.session_id))
-        conn.commit()
-        conn.close()
+        with self._write_cursor(cursor) as cur:
+            cur.execute(SQL_UPDATE_PHASE, (phase, self.session_id))
 
     def get_session_info(self) -> Dict[str, Any]:
         """Get current session information"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT project_goal, current_phase, created_at
-            FROM sessions
-            WHERE session_id = ?
-        """, (self.session_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with self.pool.acquire_read() as conn:
+            row = conn.execute(SQL_GET_SESSION_INFO, (self.session_id,)).fetchone()
 
         if row:
             return {
@@ -261,43 +357,72 @@ class ProjectState:
 
     def get_completed_tasks_count(self) -> int:
         """Get count of completed tasks"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT COUNT(*) FROM tasks
-            WHERE session_id = ? AND status = 'completed'
-        """, (self.session_id,))
-        count = cursor.fetchone()[0]
-        conn.close()
-        return count
+        with self.pool.acquire_read() as conn:
+            return conn.execute(SQL_COUNT_COMPLETED_TASKS, (self.session_id,)).fetchone()[0]
 
     def get_active_agents(self) -> List[str]:
         """Get list of active agent roles"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT DISTINCT role FROM agents
-            WHERE session_id = ? AND status = 'active'
-        """, (self.session_id,))
-        roles = [row[0] for row in cursor.fetchall()]
-        conn.close()
-        return roles
+        with self.pool.acquire_read() as conn:
+            return [row[0] for row in conn.execute(SQL_GET_ACTIVE_AGENTS, (self.session_id,))]
+
+    def get_report_snapshot(self) -> Dict[str, Any]:
+        """Get session info, completed task count and active agents together
+
+        Runs the three report queries on one reader connection and cursor,
+        so a progress report costs a single pool acquisition.
+        """
+        params = (self.session_id,)
+        with self.pool.acquire_read() as conn:
+            cur = conn.cursor()
+            cur.row_factory = sqlite3.Row
+            session = cur.execute(SQL_GET_SESSION_INFO, params).fetchone()
+            completed = cur.execute(SQL_COUNT_COMPLETED_TASKS, params).fetchone()[0]
+            agents = [row["role"] for row in cur.execute(SQL_GET_ACTIVE_AGENTS, params)]
+
+        return {
+            "session": dict(session) if session else {},
+            "completed_tasks": completed,
+            "active_agents": agents,
+        }
+
+
+def write_block(lines: List[str]):
+    """Write a block of output lines with one write and one flush
+
+    Phases build their output as a list and emit it here, so each phase's
+    block lands on stdout whole even while other phases run alongside it.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 class CoordinatorAgent:
     """Master coordinator that manages the project and subagents"""
 
+    # task_sync is imported on first use; False until then, None if missing
+    _task_sync_class = False
+
     def __init__(self, project_goal: str, project_dir: Optional[Path] = None):
         self.project_goal = project_goal
         self.project_dir = project_dir or Path.cwd()
         self.state = ProjectState(self.project_dir)
         self.state.create_session(project_goal)
 
+        # Import task synchronization
+        if CoordinatorAgent._task_sync_class is False:
+            try:
+                from task_sync import TaskSync
+                CoordinatorAgent._task_sync_class = TaskSync
+            except ImportError:
+                print("⚠️  task_sync.py not found. Task synchronization disabled.")
+                CoordinatorAgent._task_sync_class = None
+        TaskSync = CoordinatorAgent._task_sync_class
+
         # Initialize task synchronization
         self.task_sync = None
         if TaskSync:
             try:
-                self.task_sync = TaskSync(self.project_dir)
+                self.task_sync = TaskSync(self.project_dir, pool=self.state.pool)
                 print("✅ Task synchronization enabled")
             except Exception as e:
                 print(f"⚠️  Could not initialize task sync: {e}")
@@ -314,42 +439,55 @@ class CoordinatorAgent:
             return
 
         try:
-            tasks = json.loads(tasks_json)
+            tasks = _json_loads(tasks_json)
+        except json.JSONDecodeError as e:
+            print(f"⚠️  JSON parsing error while syncing tasks: {e}")
+            return
 
-            if not isinstance(tasks, list):
-                print(f"⚠️  Expected array of tasks, got {type(tasks)}")
-                return
+        self.sync_tasks(tasks)
+
+    def sync_tasks(self, tasks: List[Dict[str, Any]]):
+        """
+        Sync already-parsed tasks to SQLite database.
+        Use this instead of sync_tasks_from_json when the tasks are in-process.
+
+        Args:
+            tasks: List of task dicts as returned by TaskList
+        """
+        if not self.task_sync:
+            return
 
-            synced_count = 0
+        if not isinstance(tasks, list):
+            print(f"⚠️  Expected array of tasks, got {type(tasks)}")
+            return
+
+        try:
+            new_tasks = []
+            status_updates = []
             for task in tasks:
                 task_id = task.get('id') or task.get('task_id')
+                if not task_id:
+                    continue
+                task_id = str(task_id)
                 subject = task.get('subject', '')
                 description = task.get('description', subject)
                 status = task.get('status', 'pending')
                 owner = task.get('owner')
 
-                if task_id:
-                    # Check if task already exists in SQLite
-                    conn = sqlite3.connect(self.state.db_path)
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT id FROM tasks WHERE task_id = ?", (str(task_id),))
-                    exists = cursor.fetchone()
-                    conn.close()
+                new_tasks.append((task_id, owner, description))
 
-                    if not exists:
-                        # Create new task in SQLite
-                        self.task_sync.create_task(str(task_id), description, owner)
-                        synced_count += 1
+                # Update status if changed
+                if status != 'pending':
+                    status_updates.append((task_id, status))
 
-                    # Update status if changed
-                    if status != 'pending':
-                        self.task_sync.update_task(str(task_id), status=status)
+            with self.state.transaction() as cur:
+                # Tasks that already exist are skipped by the unique index
+                synced_count = self.state.add_tasks(new_tasks, cursor=cur)
+                self.state.set_task_statuses(status_updates, cursor=cur)
 
             if synced_count > 0:
                 print(f"✅ Synced {synced_count} new tasks to SQLite database")
 
-        except json.JSONDecodeError as e:
-            print(f"⚠️  JSON parsing error while syncing tasks: {e}")
         except Exception as e:
             print(f"⚠️  Error syncing tasks: {e}")
 
@@ -370,19 +508,55 @@ class CoordinatorAgent:
         print(f"   python3 ~/.claude/scripts/sync_tasks_to_db.py {self.project_dir}")
         print()
 
-    def initialize_project(self):
-        """Initialize the project with task breakdown and agent spawning"""
-        print("🚀 Autonomous Project Agent Harness Starting...")
-        print(f"📋 Project Goal: {self.project_goal}")
-        print(f"📁 Working Directory: {self.project_dir}")
-        print()
+    async def run_subagent(self, role: str, prompt: str):
+        """Dispatch a prompt to a subagent and wait for it to finish"""
+        # In a real implementation, this would use the Task tool to spawn an agent.
+        # For now we only yield to the scheduler so independent phases interleave.
+        import asyncio
 
-        # Phase 1: Planning
-        print("=" * 80)
-        print("PHASE 1: PLANNING & ARCHITECTURE")
-        print("=" * 80)
-        self.state.set_phase("planning")
+        await asyncio.sleep(0)
+
+    async def initialize_project(self):
+        """Initialize the project with task breakdown and agent spawning
 
+        Phases run as soon as the phases they depend on (PHASE_DEPENDENCIES)
+        have finished, so review, testing and documentation overlap once
+        implementation is underway.
+        """
+        # Imported here, as only a new run needs it; resume and report
+        # paths start without loading asyncio
+        import asyncio
+
+        out = []
+        out.append("🚀 Autonomous Project Agent Harness Starting...")
+        out.append(f"📋 Project Goal: {self.project_goal}")
+        out.append(f"📁 Working Directory: {self.project_dir}")
+        out.append("")
+        write_block(out)
+
+        runners = {
+            "planning": self._run_planning,
+            "implementation": self._run_implementation,
+            "quality_check": self._run_quality_check,
+            "testing": self._run_testing,
+            "documentation": self._run_documentation,
+        }
+        finished = {phase: asyncio.Event() for phase in PHASE_DEPENDENCIES}
+
+        async def schedule(phase: str):
+            for dependency in PHASE_DEPENDENCIES[phase]:
+                await finished[dependency].wait()
+            await runners[phase]()
+            finished[phase].set()
+
+        await asyncio.gather(*(asyncio.create_task(schedule(phase)) for phase in PHASE_DEPENDENCIES))
+
+    async def _run_planning(self):
+        # Phase 1: Planning
+        out = []
+        out.append("=" * 80)
+        out.append("PHASE 1: PLANNING & ARCHITECTURE")
+        out.append("=" * 80)
         planning_prompt = f"""You are the Planning Agent for this project.
 
 PROJECT GOAL:
@@ -407,111 +581,139 @@ After creating all tasks, use TaskList to get all tasks and output the result.
 
 Create the initial task tree now."""
 
-        print(f"\n📝 Spawning Planner Agent...")
-        print(f"Prompt: {planning_prompt[:200]}...\n")
+        out.append(f"\n📝 Spawning Planner Agent...")
+        out.append(f"Prompt: {planning_prompt[:200]}...\n")
 
-        # In a real implementation, this would use the Task tool to spawn an agent
-        # For now, we'll simulate the output
-        print("✅ Planner Agent completed initial breakdown")
-        print("   - Created 8 tasks")
-        print("   - Defined architecture: Local database + TypeScript + Modern frontend")
-        print("   - Set up dependency chain")
-        print()
+        await self.run_subagent("planner", planning_prompt)
 
-        # Record agent in database
-        self.state.add_agent("planner", "planner_001")
+        # For now, we'll simulate the output
+        out.append("✅ Planner Agent completed initial breakdown")
+        out.append("   - Created 8 tasks")
+        out.append("   - Defined architecture: Local database + TypeScript + Modern frontend")
+        out.append("   - Set up dependency chain")
+        out.append("")
+        write_block(out)
+
+        # Record phase and agent in database with a single commit
+        with self.state.transaction() as cur:
+            self.state.set_phase("planning", cursor=cur)
+            self.state.add_agent("planner", "planner_001", cursor=cur)
 
         # Sync tasks to SQLite (if running as skill, this will sync Claude Code tasks)
         self.sync_tasks_if_available()
 
+    async def _run_implementation(self):
         # Phase 2: Implementation
-        print("=" * 80)
-        print("PHASE 2: IMPLEMENTATION")
-        print("=" * 80)
+        out = []
+        out.append("=" * 80)
+        out.append("PHASE 2: IMPLEMENTATION")
+        out.append("=" * 80)
         self.state.set_phase("implementation")
 
-        print("\n🔨 Spawning Builder Agent for first task...")
-        print("✅ Builder Agent started on Task #1: Project Setup")
-        print()
+        out.append("\n🔨 Spawning Builder Agent for first task...")
+        await self.run_subagent("builder", "Task #1: Project Setup")
+        out.append("✅ Builder Agent started on Task #1: Project Setup")
+        out.append("")
+        write_block(out)
 
+    async def _run_quality_check(self):
         # Phase 3: Quality Check
-        print("=" * 80)
-        print("PHASE 3: QUALITY ASSURANCE")
-        print("=" * 80)
+        out = []
+        out.append("=" * 80)
+        out.append("PHASE 3: QUALITY ASSURANCE")
+        out.append("=" * 80)
         self.state.set_phase("quality_check")
 
-        print("\n🔍 Spawning Quality Checker Agent...")
-        print("✅ Quality Checker reviewing completed work")
-        print()
+        out.append("\n🔍 Spawning Quality Checker Agent...")
+        await self.run_subagent("quality_checker", "Review completed work")
+        out.append("✅ Quality Checker reviewing completed work")
+        out.append("")
+        write_block(out)
 
+    async def _run_testing(self):
         # Phase 4: Testing
-        print("=" * 80)
-        print("PHASE 4: TESTING & VALIDATION")
-        print("=" * 80)
+        out = []
+        out.append("=" * 80)
+        out.append("PHASE 4: TESTING & VALIDATION")
+        out.append("=" * 80)
         self.state.set_phase("testing")
 
-        print("\n🧪 Spawning Tester Agent...")
-        print("✅ Tester writing and running tests")
-        print()
+        out.append("\n🧪 Spawning Tester Agent...")
+        await self.run_subagent("tester", "Write and run tests")
+        out.append("✅ Tester writing and running tests")
+        out.append("")
+        write_block(out)
 
+    async def _run_documentation(self):
         # Phase 5: Documentation
-        print("=" * 80)
-        print("PHASE 5: DOCUMENTATION")
-        print("=" * 80)
+        out = []
+        out.append("=" * 80)
+        out.append("PHASE 5: DOCUMENTATION")
+        out.append("=" * 80)
         self.state.set_phase("documentation")
 
-        print("\n📚 Spawning Documentation Agent...")
-        print("✅ Documenter creating README and guides")
-        print()
+        out.append("\n📚 Spawning Documentation Agent...")
+        await self.run_subagent("documenter", "Create README and guides")
+        out.append("✅ Documenter creating README and guides")
+        out.append("")
+        write_block(out)
 
     def generate_report(self):
         """Generate end-of-session progress report"""
-        session_info = self.state.get_session_info()
-        completed_tasks = self.state.get_completed_tasks_count()
-        active_agents = self.state.get_active_agents()
-
-        report = {
-            "phase": session_info.get("current_phase", "unknown"),
-            "completed_tasks": completed_tasks,
-            "active_agents": active_agents,
-            "blockers": [],
-            "next_priorities": [],
-            "recommendations": []
-        }
-
-        self.state.add_report(report)
-
-        print()
-        print("=" * 80)
-        print("📊 PROJECT PROGRESS REPORT")
-        print("=" * 80)
-        print(f"Session ID: {self.state.session_id}")
-        print(f"Current Phase: {report['phase']}")
-        print(f"Completed Tasks: {report['completed_tasks']}")
-        print(f"Active Agents: {', '.join(report['active_agents']) or 'None'}")
-        print()
-        print("🎯 NEXT PRIORITIES:")
-        print("   1. Complete remaining implementation tasks")
-        print("   2. Run full test suite")
-        print("   3. Generate deployment documentation")
-        print()
-        print("⚠️  BLOCKERS: None")
-        print()
-        print("💡 RECOMMENDATIONS:")
-        print("   - Continue with current approach")
-        print("   - Monitor test coverage")
-        print("   - Prepare deployment checklist")
-        print("=" * 80)
+        return generate_report(self.state)
 
 
-# Global variable to track web server process
-web_server_process = None
+def generate_report(state: ProjectState) -> Dict[str, Any]:
+    """Record and print a progress report for state's session
 
+    Only needs a ProjectState, so resuming a session can report on it
+    without building a coordinator (which would start a new session).
+    """
+    snapshot = state.get_report_snapshot()
 
-def launch_web_gui(project_dir: Path, port: int = 5000):
-    """Launch the web GUI in a background process"""
-    global web_server_process
+    report = {
+        "phase": snapshot["session"].get("current_phase", "unknown"),
+        "completed_tasks": snapshot["completed_tasks"],
+        "active_agents": snapshot["active_agents"],
+        "blockers": [],
+        "next_priorities": [],
+        "recommendations": []
+    }
 
+    state.add_report(report)
+
+    out = [""]
+    out.append("=" * 80)
+    out.append("📊 PROJECT PROGRESS REPORT")
+    out.append("=" * 80)
+    out.append(f"Session ID: {state.session_id}")
+    out.append(f"Current Phase: {report['phase']}")
+    out.append(f"Completed Tasks: {report['completed_tasks']}")
+    out.append(f"Active Agents: {', '.join(report['active_agents']) or 'None'}")
+    out.append("")
+    out.append("🎯 NEXT PRIORITIES:")
+    out.append("   1. Complete remaining implementation tasks")
+    out.append("   2. Run full test suite")
+    out.append("   3. Generate deployment documentation")
+    out.append("")
+    out.append("⚠️  BLOCKERS: None")
+    out.append("")
+    out.append("💡 RECOMMENDATIONS:")
+    out.append("   - Continue with current approach")
+    out.append("   - Monitor test coverage")
+    out.append("   - Prepare deployment checklist")
+    out.append("=" * 80)
+    write_block(out)
+    return report
+
+
+def launch_web_gui(project_dir: Path, port: int = 5000, pool: Optional[ConnectionPool] = None):
+    """Serve the web GUI from a background thread in this process
+
+    Sharing the interpreter avoids a second Python startup, and passing the
+    coordinator's pool lets the GUI reuse its SQLite connections. The server
+    thread is a daemon, so it stops when the coordinator exits.
+    """
     # Path to the web GUI script
     web_script = Path(__file__).parent / "autonomous_project_web.py"
 
@@ -520,17 +722,33 @@ def launch_web_gui(project_dir: Path, port: int = 5000):
         print("   Continuing without web interface...")
         return None
 
+    import webbrowser
+
+    try:
+        # When run as a script this module is __main__; register it under its
+        # own name so the web module's import doesn't load a second copy
+        sys.modules.setdefault("autonomous_project", sys.modules[__name__])
+        # The web module exits if Flask is missing
+        import autonomous_project_web as web
+        from werkzeug.serving import WSGIRequestHandler, make_server
+    except (ImportError, SystemExit):
+        print("   Continuing without web interface...")
+        return None
+
+    class QuietRequestHandler(WSGIRequestHandler):
+        """Keep per-request access logs out of the coordinator's output"""
+
+        def log(self, type, message, *args):
+            pass
+
     try:
-        # Launch web server in background
         print(f"\n🌐 Launching Web GUI at http://localhost:{port}")
-        web_server_process = subprocess.Popen(
-            [sys.executable, str(web_script), "--web", "--port", str(port), "--dir", str(project_dir)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
+        web.state = web.ProjectState(project_dir, pool=pool)
+        # make_server binds immediately, so the port is ready once it returns
+        server = make_server(
+            "0.0.0.0", port, web.app, threaded=True, request_handler=QuietRequestHandler
         )
-
-        # Give server time to start
-        time.sleep(2)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
 
         # Open browser
         webbrowser.open(f"http://localhost:{port}")
@@ -538,77 +756,81 @@ def launch_web_gui(project_dir: Path, port: int = 5000):
         print(f"✅ Web GUI running at http://localhost:{port}")
         print(f"   Monitor agents and tasks in real-time!\n")
 
-        return web_server_process
+        return server
 
+    except SystemExit:
+        # werkzeug exits instead of raising when the port is taken, after
+        # printing why
+        print("   Continuing without web interface...")
+        return None
     except Exception as e:
         print(f"⚠️  Could not launch web GUI: {e}")
         print("   Continuing without web interface...")
         return None
 
 
-def cleanup_web_server():
-    """Clean up web server process on exit"""
-    global web_server_process
-    if web_server_process:
-        try:
-            web_server_process.terminate()
-            web_server_process.wait(timeout=5)
-        except:
-            pass
-
-
-# Register cleanup handler
-atexit.register(cleanup_web_server)
+def _subcommand_argv(argv: List[str]) -> List[str]:
+    """Map the original flag-style invocations onto the run/resume subcommands"""
+    if argv and argv[0] in ("run", "resume", "-h", "--help"):
+        return argv
+    for i, arg in enumerate(argv):
+        if arg == "--resume" and i + 1 < len(argv):
+            return ["resume", argv[i + 1]] + argv[:i] + argv[i + 2:]
+        if arg.startswith("--resume="):
+            return ["resume", arg.split("=", 1)[1]] + argv[:i] + argv[i + 1:]
+    return ["run"] + argv
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Autonomous Project Agent Harness - Coordinate AI agents to build projects"
     )
-    parser.add_argument(
-        "project_goal",
-        nargs="?",
-        help="Description of the project to build"
-    )
-    parser.add_argument(
-        "--resume",
-        help="Resume a previous session by session ID"
-    )
-    parser.add_argument(
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
         "--dir",
         help="Project directory (defaults to current directory)",
         default="."
     )
-    parser.add_argument(
+    subparsers = parser.add_subparsers(dest="cmd", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", parents=[common], help="Start a new project session (default)"
+    )
+    run_parser.add_argument(
+        "project_goal",
+        nargs="?",
+        help="Description of the project to build"
+    )
+    run_parser.add_argument(
         "--no-gui",
         action="store_true",
         help="Disable automatic web GUI launch"
     )
-    parser.add_argument(
+    run_parser.add_argument(
         "--port",
         type=int,
         default=5000,
         help="Web GUI port (default: 5000)"
     )
 
-    args = parser.parse_args()
+    resume_parser = subparsers.add_parser(
+        "resume", parents=[common], help="Report on a previous session by session ID"
+    )
+    resume_parser.add_argument("session_id", help="Session ID to resume")
+
+    args = parser.parse_args(_subcommand_argv(sys.argv[1:]))
 
-    if args.resume:
-        print(f"🔄 Resuming session: {args.resume}")
-        # Load previous state and continue
-        project_dir = Path(args.dir).resolve()
-        state = ProjectState(project_dir)
-        state.session_id = args.resume
-        session_info = state.get_session_info()
+    if args.cmd == "resume":
+        print(f"🔄 Resuming session: {args.session_id}")
+        # Load previous state; no new session is created
+        state = ProjectState(Path(args.dir).resolve())
+        state.session_id = args.session_id
 
-        if not session_info:
-            print(f"❌ Error: Session {args.resume} not found")
+        if not state.get_session_info():
+            print(f"❌ Error: Session {args.session_id} not found")
             sys.exit(1)
 
-        project_goal = session_info.get("project_goal", "Unknown")
-        coordinator = CoordinatorAgent(project_goal, project_dir)
-        coordinator.state.session_id = args.resume
-        coordinator.generate_report()
+        generate_report(state)
         return
 
     if not args.project_goal:
@@ -616,7 +838,7 @@ def main():
         print()
         print("Usage:")
         print('  python3 autonomous_project.py "Build a todo app with React"')
-        print('  python3 autonomous_project.py --resume SESSION_ID')
+        print('  python3 autonomous_project.py resume SESSION_ID')
         sys.exit(1)
 
     project_dir = Path(args.dir).resolve()
@@ -624,10 +846,12 @@ def main():
 
     # Launch web GUI unless disabled
     if not args.no_gui:
-        launch_web_gui(project_dir, port=args.port)
+        launch_web_gui(project_dir, port=args.port, pool=coordinator.state.pool)
+
+    import asyncio
 
     try:
-        coordinator.initialize_project()
+        asyncio.run(coordinator.initialize_project())
         coordinator.generate_report()
 
         print()
@@ -637,12 +861,12 @@ def main():
             print(f"🌐 Web GUI: http://localhost:{args.port}")
         print()
         print("To resume this session:")
-        print(f"  python3 autonomous_project.py --resume {coordinator.state.session_id}")
+        print(f"  python3 autonomous_project.py resume {coordinator.state.session_id}")
 
     except KeyboardInterrupt:
         print("\n\n⏸️  Session paused by user")
         coordinator.generate_report()
-        print(f"\nResume with: python3 autonomous_project.py --resume {coordinator.state.session_id}")
+        print(f"\nResume with: python3 autonomous_project.py resume {coordinator.state.session_id}")
     except Exception as e:
         print(f"\n❌ Error: {e}")
         coordinator.generate_report()
@@ -10,23 +10,29 @@ Usage:
     python3 autonomous_project_web.py "Build a todo app"      # CLI mode (original)
 """
 
+import atexit
+import gzip
 import json
 import sys
 import sqlite3
-import time
 import socket
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import argparse
+import asyncio
+import hashlib
+import importlib.util
+import secrets
+import time
 import webbrowser
-from threading import Thread
+from contextlib import contextmanager
+from threading import Condition, Lock, Timer
 
 try:
     from flask import (
         Flask,
-        render_template_string,
-        jsonify,
+        abort,
         request,
         send_from_directory,
     )
@@ -36,202 +42,204 @@ except ImportError:
 
 # Import the original coordinator
 sys.path.insert(0, str(Path(__file__).parent))
+from autonomous_project import AGENT_ROLES, _json_loads, decode_report_data, orjson
+from project_db import ConnectionPool, WriteQueue, create_schema
+
+# Every query the API runs, as fixed strings so each hits the pooled
+# connections' statement cache (see SQLITE_CACHED_STATEMENTS)
+
+# Timestamps written by the API are generated by SQLite itself, in the same
+# local-time ISO format the coordinator uses (to the millisecond)
+SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+
+SQL_GET_SESSIONS = """
+    SELECT session_id, created_at, project_goal, current_phase
+    FROM sessions
+    ORDER BY created_at DESC
+"""
+SQL_GET_TASKS = """
+    SELECT id, session_id, task_id, agent_role, description, status, created_at, completed_at
+    FROM tasks
+    ORDER BY created_at DESC
+"""
+SQL_GET_TASKS_BY_SESSION = """
+    SELECT id, session_id, task_id, agent_role, description, status, created_at, completed_at
+    FROM tasks
+    WHERE session_id = ?
+    ORDER BY created_at DESC
+"""
+SQL_GET_AGENTS = """
+    SELECT id, session_id, role, agent_id, started_at, status
+    FROM agents
+    ORDER BY started_at DESC
+"""
+SQL_GET_AGENTS_BY_SESSION = """
+    SELECT id, session_id, role, agent_id, started_at, status
+    FROM agents
+    WHERE session_id = ?
+    ORDER BY started_at DESC
+"""
+SQL_GET_REPORTS = """
+    SELECT id, session_id, timestamp, phase, completed_tasks, data, data_z, compressed
+    FROM reports
+    ORDER BY timestamp DESC
+"""
+SQL_GET_REPORTS_BY_SESSION = """
+    SELECT id, session_id, timestamp, phase, completed_tasks, data, data_z, compressed
+    FROM reports
+    WHERE session_id = ?
+    ORDER BY timestamp DESC
+"""
+SQL_INSERT_TASK = f"""
+    INSERT OR IGNORE INTO tasks (session_id, task_id, agent_role, description, created_at)
+    VALUES (?, ?, ?, ?, {SQL_NOW})
+"""
+SQL_UPDATE_TASK = f"""
+    UPDATE tasks
+    SET status = COALESCE(?1, status),
+        agent_role = COALESCE(?2, agent_role),
+        description = COALESCE(?3, description),
+        completed_at = CASE WHEN ?1 = 'completed' THEN {SQL_NOW} ELSE completed_at END
+    WHERE task_id = ?4
+"""
+SQL_DELETE_TASK = "DELETE FROM tasks WHERE task_id = ?"
 
-# Agent role definitions
-AGENT_ROLES = {
-    "planner": {
-        "description": "Analyzes requirements, creates task breakdowns, designs architecture",
-        "subagent_type": "Plan",
-        "authority": ["create_tasks", "update_architecture", "define_requirements"],
-    },
-    "builder": {
-        "description": "Implements features, writes code, creates files",
-        "subagent_type": "general-purpose",
-        "authority": ["write_code", "edit_files", "create_components"],
-    },
-    "quality_checker": {
-        "description": "Reviews code quality, enforces standards, validates implementations",
-        "subagent_type": "general-purpose",
-        "authority": ["review_code", "request_changes", "approve_tasks"],
-    },
-    "tester": {
-        "description": "Writes tests, validates functionality, ensures correctness",
-        "subagent_type": "general-purpose",
-        "authority": ["write_tests", "run_tests", "validate_features"],
-    },
-    "documenter": {
-        "description": "Creates documentation, comments code, maintains README",
-        "subagent_type": "general-purpose",
-        "authority": ["write_docs", "update_readme", "create_guides"],
-    },
-}
+# Accepted agent_role values, checked before a write reaches SQLite; the
+# coordinator's role table, so every role it can spawn is assignable here
+VALID_ROLES = frozenset(AGENT_ROLES)
 
 
 class ProjectState:
     """Manages persistent project state using SQLite"""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, pool: Optional[ConnectionPool] = None):
         self.project_dir = project_dir
         self.db_path = project_dir / ".autonomous_project.db"
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Reuse the coordinator's pool when running in-process
+        self._owns_pool = pool is None
+        self.pool = pool or ConnectionPool(self.db_path)
+        # API writes from concurrent requests are committed in shared batches
+        self.writes = WriteQueue(self.pool)
+        self._snapshot_lock = Lock()
+        self._snapshot_cache = None
         self._init_database()
+        if self._owns_pool:
+            atexit.register(self.close)
 
     def _init_database(self):
         """Initialize SQLite database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Sessions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sessions (
-                session_id TEXT PRIMARY KEY,
-                created_at TEXT NOT NULL,
-                project_goal TEXT NOT NULL,
-                current_phase TEXT DEFAULT 'initialization'
-            )
-        """)
-
-        # Agents table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS agents (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                role TEXT NOT NULL,
-                agent_id TEXT,
-                started_at TEXT NOT NULL,
-                status TEXT DEFAULT 'active',
-                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-            )
-        """)
-
-        # Tasks table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                task_id TEXT NOT NULL,
-                agent_role TEXT,
-                description TEXT,
-                status TEXT DEFAULT 'pending',
-                created_at TEXT NOT NULL,
-                completed_at TEXT,
-                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-            )
-        """)
-
-        # Reports table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS reports (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                phase TEXT,
-                completed_tasks INTEGER,
-                data TEXT,
-                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-            )
-        """)
-
-        conn.commit()
-        conn.close()
-
-    def get_all_sessions(self) -> List[Dict[str, Any]]:
-        """Get all sessions"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT session_id, created_at, project_goal, current_phase
-            FROM sessions
-            ORDER BY created_at DESC
-        """)
-        sessions = []
-        for row in cursor.fetchall():
-            sessions.append(
-                {
-                    "session_id": row[0],
-                    "created_at": row[1],
-                    "project_goal": row[2],
-                    "current_phase": row[3],
+        with self.pool.acquire_write() as conn:
+            self._create_tables(conn)
+
+    def _create_tables(self, conn: sqlite3.Connection):
+        """Apply the shared schema, then add the indexes only the API needs"""
+        create_schema(conn)
+
+        # The API's newest-first listings, which these compound indexes
+        # serve without a sort step
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_session_created ON tasks(session_id, created_at DESC)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_agents_session_started ON agents(session_id, started_at DESC)"
+        )
+
+    def close(self):
+        """Close the pool's connections if this state opened it"""
+        if self._owns_pool:
+            self.pool.close()
+
+    @contextmanager
+    def _read_cursor(self, cursor: Optional[sqlite3.Cursor] = None):
+        """Yield cursor if given, else a Row cursor on a pooled reader"""
+        if cursor is not None:
+            yield cursor
+            return
+        with self.pool.acquire_read() as conn:
+            cur = conn.cursor()
+            cur.row_factory = sqlite3.Row
+            yield cur
+
+    def get_snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get every task, agent and session using one reader connection
+
+        The three queries share a read transaction, so the lists come from
+        the same database snapshot.
+        """
+        with self._read_cursor() as cursor:
+            cursor.execute("BEGIN")
+            try:
+                return {
+                    "tasks": self.get_all_tasks(cursor=cursor),
+                    "agents": self.get_all_agents(cursor=cursor),
+                    "sessions": self.get_all_sessions(cursor=cursor),
                 }
-            )
-        conn.close()
-        return sessions
+            finally:
+                cursor.execute("COMMIT")
+
+    def get_snapshot_json(self) -> Tuple[bytes, str]:
+        """Get the encoded snapshot and its ETag, re-queried only after writes"""
+        token = self.pool.change_token()
+        with self._snapshot_lock:
+            if self._snapshot_cache is None or self._snapshot_cache[0] != token:
+                body = _encode_json(self.get_snapshot())
+                etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+                self._snapshot_cache = (token, body, etag)
+            return self._snapshot_cache[1:]
+
+    def get_all_sessions(self, cursor: Optional[sqlite3.Cursor] = None) -> List[Dict[str, Any]]:
+        """Get all sessions"""
+        with self._read_cursor(cursor) as cursor:
+            cursor.execute(SQL_GET_SESSIONS)
+            return [dict(row) for row in cursor]
 
-    def get_all_tasks(self, session_id: str = None) -> List[Dict[str, Any]]:
+    def get_all_tasks(
+        self, session_id: str = None, cursor: Optional[sqlite3.Cursor] = None
+    ) -> List[Dict[str, Any]]:
         """Get all tasks, optionally filtered by session"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        if session_id:
-            cursor.execute(
-                """
-                SELECT id, session_id, task_id, agent_role, description, status, created_at, completed_at
-                FROM tasks
-                WHERE session_id = ?
-                ORDER BY created_at DESC
-            """,
-                (session_id,),
-            )
-        else:
-            cursor.execute("""
-                SELECT id, session_id, task_id, agent_role, description, status, created_at, completed_at
-                FROM tasks
-                ORDER BY created_at DESC
-            """)
-
-        tasks = []
-        for row in cursor.fetchall():
-            tasks.append(
-                {
-                    "id": row[0],
-                    "session_id": row[1],
-                    "task_id": row[2],
-                    "agent_role": row[3],
-                    "description": row[4],
-                    "status": row[5],
-                    "created_at": row[6],
-                    "completed_at": row[7],
-                }
-            )
-        conn.close()
-        return tasks
+        with self._read_cursor(cursor) as cursor:
+            if session_id:
+                cursor.execute(SQL_GET_TASKS_BY_SESSION, (session_id,))
+            else:
+                cursor.execute(SQL_GET_TASKS)
 
-    def get_all_agents(self, session_id: str = None) -> List[Dict[str, Any]]:
+            return [dict(row) for row in cursor]
+
+    def get_all_agents(
+        self, session_id: str = None, cursor: Optional[sqlite3.Cursor] = None
+    ) -> List[Dict[str, Any]]:
         """Get all agents, optionally filtered by session"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        if session_id:
-            cursor.execute(
-                """
-                SELECT id, session_id, role, agent_id, started_at, status
-                FROM agents
-                WHERE session_id = ?
-                ORDER BY started_at DESC
-            """,
-                (session_id,),
-            )
-        else:
-            cursor.execute("""
-                SELECT id, session_id, role, agent_id, started_at, status
-                FROM agents
-                ORDER BY started_at DESC
-            """)
-
-        agents = []
-        for row in cursor.fetchall():
-            agents.append(
-                {
-                    "id": row[0],
-                    "session_id": row[1],
-                    "role": row[2],
-                    "agent_id": row[3],
-                    "started_at": row[4],
-                    "status": row[5],
-                }
-            )
-        conn.close()
-        return agents
+        with self._read_cursor(cursor) as cursor:
+            if session_id:
+                cursor.execute(SQL_GET_AGENTS_BY_SESSION, (session_id,))
+            else:
+                cursor.execute(SQL_GET_AGENTS)
+
+            return [dict(row) for row in cursor]
+
+    def get_all_reports(
+        self, session_id: str = None, cursor: Optional[sqlite3.Cursor] = None
+    ) -> List[Dict[str, Any]]:
+        """Get all progress reports, optionally filtered by session"""
+        with self._read_cursor(cursor) as cursor:
+            if session_id:
+                cursor.execute(SQL_GET_REPORTS_BY_SESSION, (session_id,))
+            else:
+                cursor.execute(SQL_GET_REPORTS)
+
+            reports = [dict(row) for row in cursor]
+        for report in reports:
+            try:
+                report["data"] = decode_report_data(
+                    report["data"], report.pop("data_z"), report.pop("compressed")
+                )
+            except RuntimeError as e:
+                # Compressed without zstandard installed here; the rest of
+                # the reports still load
+                report["data"] = None
+                report["error"] = str(e)
+        return reports
 
     def add_task(
         self,
@@ -239,20 +247,29 @@ class ProjectState:
         agent_role: str = None,
         description: str = None,
         session_id: str = None,
-    ):
-        """Add a new task"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    ) -> int:
+        """Add a new task, returning 0 if the session already has task_id"""
         sid = session_id or self.session_id
-        cursor.execute(
-            """
-            INSERT INTO tasks (session_id, task_id, agent_role, description, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """,
-            (sid, task_id, agent_role, description, datetime.now().isoformat()),
+        return self.writes.submit(
+            lambda cursor: cursor.execute(
+                SQL_INSERT_TASK, (sid, task_id, agent_role, description)
+            ).rowcount
         )
-        conn.commit()
-        conn.close()
+
+    def add_tasks(self, tasks: List[Dict[str, Any]], session_id: str = None) -> int:
+        """Add many tasks in a single transaction
+
+        Each task is a dict shaped like the add_task arguments. Like add_task,
+        a task id already present in the session is skipped (the shared
+        schema's uq_tasks_session_task index); returns the number of rows
+        actually inserted.
+        """
+        sid = session_id or self.session_id
+        rows = [
+            (sid, task["task_id"], task.get("agent_role"), task.get("description"))
+            for task in tasks
+        ]
+        return self.writes.submit(lambda cursor: cursor.executemany(SQL_INSERT_TASK, rows).rowcount)
 
     def update_task(
         self,
@@ -261,48 +278,135 @@ class ProjectState:
         agent_role: str = None,
         description: str = None,
     ):
-        """Update a task"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Update a task, leaving fields that are not given unchanged"""
+        # Empty values mean "not given", as the edit form sends them
+        params = (status or None, agent_role or None, description or None, task_id)
+        self.writes.submit(lambda cursor: cursor.execute(SQL_UPDATE_TASK, params))
+
+    def delete_task(self, task_id: str):
+        """Delete a task"""
+        self.writes.submit(lambda cursor: cursor.execute(SQL_DELETE_TASK, (task_id,)))
+
+    def delete_tasks(self, task_ids: List[str]) -> int:
+        """Delete many tasks in a single transaction, returning the rows removed"""
+        rows = [(task_id,) for task_id in task_ids]
+        return self.writes.submit(lambda cursor: cursor.executemany(SQL_DELETE_TASK, rows).rowcount)
 
-        updates = []
-        params = []
 
-        if status:
-            updates.append("status = ?")
-            params.append(status)
-            if status == "completed":
-                updates.append("completed_at = ?")
-                params.append(datetime.now().isoformat())
+# Flask Web App
+app = Flask(__name__)
+state = None
 
-        if agent_role:
-            updates.append("agent_role = ?")
-            params.append(agent_role)
 
-        if description:
-            updates.append("description = ?")
-            params.append(description)
+# How often an idle event stream re-checks the database, which picks up
+# writes made outside the API (the coordinator, TaskSync) and keeps the
+# connection alive
+EVENT_POLL_INTERVAL = 3.0
 
-        if updates:
-            params.append(task_id)
-            query = f"UPDATE tasks SET {', '.join(updates)} WHERE task_id = ?"
-            cursor.execute(query, params)
-            conn.commit()
+# An event stream holds a server thread for as long as it is open, so each
+# one ends after this many seconds and the browser reconnects after
+# EVENT_RETRY_MS; a closed tab's thread is freed within the lifetime
+EVENT_STREAM_LIFETIME = 30.0
+EVENT_RETRY_MS = 1000
 
-        conn.close()
+# Worker threads for the thread-pooled servers (waitress, uvicorn). Every
+# open dashboard tab keeps one busy with its event stream, so this leaves
+# room for a few dozen tabs plus their ordinary API requests.
+SERVER_THREADS = 32
 
-    def delete_task(self, task_id: str):
-        """Delete a task"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
-        conn.commit()
-        conn.close()
 
+class ChangeFeed:
+    """Version counter that wakes event streams when the API changes data"""
 
-# Flask Web App
-app = Flask(__name__)
-state = None
+    def __init__(self):
+        self._cond = Condition()
+        self.version = 0
+
+    def notify(self):
+        with self._cond:
+            self.version += 1
+            self._cond.notify_all()
+
+    def wait(self, version: int, timeout: float) -> int:
+        """Block until the version moves past version or timeout passes"""
+        with self._cond:
+            self._cond.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+
+changes = ChangeFeed()
+
+
+def _encode_json(obj: Any) -> bytes:
+    """Compact JSON bytes for a response body, via orjson if installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def json_response(obj: Any, status: int = 200):
+    """Serialise obj straight to a JSON response body"""
+    return app.response_class(_encode_json(obj), status=status, mimetype="application/json")
+
+
+# Distinguishes this process's change-token ETags from a previous run's
+ETAG_PREFIX = secrets.token_hex(4)
+
+
+# Encoded listing bodies for the current change token, shared by all
+# clients; dropped wholesale whenever the database changes
+RESPONSE_CACHE_SIZE = 128
+_response_cache: Dict[Any, bytes] = {}
+_response_cache_token = None
+_response_cache_lock = Lock()
+
+
+def _cached_body(token: tuple, key: Any, fetch) -> bytes:
+    global _response_cache_token
+    # Held across the fetch so concurrent misses for a key query only once
+    with _response_cache_lock:
+        if _response_cache_token != token:
+            _response_cache.clear()
+            _response_cache_token = token
+        body = _response_cache.get(key)
+        if body is None:
+            if len(_response_cache) >= RESPONSE_CACHE_SIZE:
+                _response_cache.clear()
+            body = _response_cache[key] = _encode_json(fetch())
+        return body
+
+
+def conditional_json(key: Any, fetch):
+    """JSON response for fetch(), or an empty 304 if the client is current
+
+    The weak ETag comes from the pool's change token, so a revalidation
+    that finds the database unchanged costs no query or serialisation, and
+    other clients asking for the same key get the cached body.
+    """
+    token = state.pool.change_token()
+    etag = "{}-{}-{}".format(ETAG_PREFIX, *token)
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(_cached_body(token, key, fetch), mimetype="application/json")
+    response.set_etag(etag, weak=True)
+    return response
+
+
+@app.errorhandler(sqlite3.OperationalError)
+def database_unavailable(error):
+    """Locked or unreachable database (busy_timeout expired, writer gone)"""
+    response = json_response({"error": f"database unavailable: {error}"}, 503)
+    response.headers["Retry-After"] = "1"
+    return response
+
+
+def request_json() -> Dict[str, Any]:
+    """Decode the request body, rejecting malformed JSON with a 400"""
+    try:
+        return _json_loads(request.get_data())
+    except json.JSONDecodeError:
+        abort(400)
 
 
 HTML_TEMPLATE = """
@@ -631,11 +735,7 @@ HTML_TEMPLATE = """
                     <label>Agent Role</label>
                     <select name="agent_role">
                         <option value="">Unassigned</option>
-                        <option value="planner">Planner</option>
-                        <option value="builder">Builder</option>
-                        <option value="quality_checker">Quality Checker</option>
-                        <option value="tester">Tester</option>
-                        <option value="documenter">Documenter</option>
+                        <!--ROLE_OPTIONS-->
                     </select>
                 </div>
                 <div class="actions">
@@ -670,11 +770,7 @@ HTML_TEMPLATE = """
                     <label>Agent Role</label>
                     <select name="agent_role">
                         <option value="">Unassigned</option>
-                        <option value="planner">Planner</option>
-                        <option value="builder">Builder</option>
-                        <option value="quality_checker">Quality Checker</option>
-                        <option value="tester">Tester</option>
-                        <option value="documenter">Documenter</option>
+                        <!--ROLE_OPTIONS-->
                     </select>
                 </div>
                 <div class="actions">
@@ -687,24 +783,32 @@ HTML_TEMPLATE = """
 
     <script>
         let currentEditTaskId = null;
+        let snapshotEtag = null;
+        let lastTasks = [];
 
         async function fetchData() {
             try {
-                const [tasks, agents, sessions] = await Promise.all([
-                    fetch('/api/tasks').then(r => r.json()),
-                    fetch('/api/agents').then(r => r.json()),
-                    fetch('/api/sessions').then(r => r.json())
-                ]);
-
-                renderTasks(tasks);
-                renderAgents(agents);
-                renderSessions(sessions);
-                updateStats(tasks, agents, sessions);
+                const response = await fetch('/api/snapshot', {
+                    headers: snapshotEtag ? { 'If-None-Match': snapshotEtag } : {}
+                });
+                if (response.status === 304) {
+                    return;
+                }
+                snapshotEtag = response.headers.get('ETag');
+                renderSnapshot(await response.json());
             } catch (error) {
                 console.error('Error fetching data:', error);
             }
         }
 
+        function renderSnapshot({ tasks, agents, sessions }) {
+            lastTasks = tasks;
+            renderTasks(tasks);
+            renderAgents(agents);
+            renderSessions(sessions);
+            updateStats(tasks, agents, sessions);
+        }
+
         function updateStats(tasks, agents, sessions) {
             document.getElementById('totalTasks').textContent = tasks.length;
             document.getElementById('activeTasks').textContent = tasks.filter(t => t.status !== 'completed').length;
@@ -712,14 +816,57 @@ HTML_TEMPLATE = """
             document.getElementById('totalSessions').textContent = sessions.length;
         }
 
-        function renderTasks(tasks) {
-            const list = document.getElementById('taskList');
-            if (tasks.length === 0) {
-                list.innerHTML = '<div class="empty-state"><div class="empty-state-icon">📭</div><p>No tasks yet. Add one to get started!</p></div>';
+        // Rendered rows per list, keyed by record id, so a refresh only
+        // replaces rows whose markup changed and leaves the rest in place
+        const listRows = new Map();
+
+        function patchList(list, items, keyOf, renderItem, emptyHtml) {
+            if (items.length === 0) {
+                list.innerHTML = emptyHtml;
+                listRows.set(list, new Map());
                 return;
             }
+            if (list.querySelector('.empty-state')) {
+                list.innerHTML = '';
+            }
+
+            const rows = listRows.get(list) || new Map();
+            const next = new Map();
+            items.forEach(item => {
+                const key = keyOf(item);
+                const html = renderItem(item).trim();
+                let row = rows.get(key);
+                if (!row || row.html !== html) {
+                    const template = document.createElement('template');
+                    template.innerHTML = html;
+                    const el = template.content.firstElementChild;
+                    if (row) {
+                        row.el.replaceWith(el);
+                    }
+                    row = { el, html };
+                }
+                next.set(key, row);
+            });
+            rows.forEach((row, key) => {
+                if (!next.has(key)) {
+                    row.el.remove();
+                }
+            });
+
+            // Move rows into the new order, touching only those out of place
+            let prev = null;
+            next.forEach(row => {
+                const expected = prev ? prev.nextElementSibling : list.firstElementChild;
+                if (row.el !== expected) {
+                    list.insertBefore(row.el, expected);
+                }
+                prev = row.el;
+            });
+            listRows.set(list, next);
+        }
 
-            list.innerHTML = tasks.map(task => `
+        function renderTasks(tasks) {
+            patchList(document.getElementById('taskList'), tasks, task => task.id, task => `
                 <li class="task-item">
                     <div class="task-header">
                         <span class="task-title">${task.task_id}</span>
@@ -736,17 +883,11 @@ HTML_TEMPLATE = """
                         <button class="btn btn-danger btn-small" onclick="deleteTask('${task.task_id}')">Delete</button>
                     </div>
                 </li>
-            `).join('');
+            `, '<div class="empty-state"><div class="empty-state-icon">📭</div><p>No tasks yet. Add one to get started!</p></div>');
         }
 
         function renderAgents(agents) {
-            const list = document.getElementById('agentList');
-            if (agents.length === 0) {
-                list.innerHTML = '<div class="empty-state"><div class="empty-state-icon">🤖</div><p>No agents spawned yet</p></div>';
-                return;
-            }
-
-            list.innerHTML = agents.map(agent => `
+            patchList(document.getElementById('agentList'), agents, agent => agent.id, agent => `
                 <li class="agent-item">
                     <div class="agent-header">
                         <span class="task-title">${agent.role}</span>
@@ -757,17 +898,11 @@ HTML_TEMPLATE = """
                         <span>📅 ${new Date(agent.started_at).toLocaleString()}</span>
                     </div>
                 </li>
-            `).join('');
+            `, '<div class="empty-state"><div class="empty-state-icon">🤖</div><p>No agents spawned yet</p></div>');
         }
 
         function renderSessions(sessions) {
-            const list = document.getElementById('sessionList');
-            if (sessions.length === 0) {
-                list.innerHTML = '<div class="empty-state"><div class="empty-state-icon">💾</div><p>No sessions found</p></div>';
-                return;
-            }
-
-            list.innerHTML = sessions.map(session => `
+            patchList(document.getElementById('sessionList'), sessions, session => session.session_id, session => `
                 <li class="session-item">
                     <div class="task-header">
                         <span class="task-title">${session.session_id}</span>
@@ -778,7 +913,7 @@ HTML_TEMPLATE = """
                         <span>📅 ${new Date(session.created_at).toLocaleString()}</span>
                     </div>
                 </li>
-            `).join('');
+            `, '<div class="empty-state"><div class="empty-state-icon">💾</div><p>No sessions found</p></div>');
         }
 
         function openAddTaskModal() {
@@ -800,10 +935,9 @@ HTML_TEMPLATE = """
             currentEditTaskId = null;
         }
 
-        async function editTask(taskId) {
-            const response = await fetch('/api/tasks');
-            const tasks = await response.json();
-            const task = tasks.find(t => t.task_id === taskId);
+        function editTask(taskId) {
+            // The list being shown is the latest snapshot, no need to refetch
+            const task = lastTasks.find(t => t.task_id === taskId);
 
             if (task) {
                 currentEditTaskId = taskId;
@@ -821,11 +955,17 @@ HTML_TEMPLATE = """
             const formData = new FormData(e.target);
             const data = Object.fromEntries(formData);
 
-            await fetch('/api/tasks', {
+            const response = await fetch('/api/tasks', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify(data)
             });
+            // e.g. 409 when the task id is taken; keep the form open
+            if (!response.ok) {
+                const { error } = await response.json().catch(() => ({}));
+                alert(error || 'Could not add task');
+                return;
+            }
 
             closeAddTaskModal();
             fetchData();
@@ -871,103 +1011,306 @@ HTML_TEMPLATE = """
             });
         });
 
-        // Initial load and refresh every 3 seconds
-        fetchData();
-        setInterval(fetchData, 3000);
+        // The server pushes a snapshot on connect and after every change;
+        // fall back to polling where EventSource is unavailable
+        if (window.EventSource) {
+            new EventSource('/api/events').onmessage = e => renderSnapshot(JSON.parse(e.data));
+        } else {
+            fetchData();
+            setInterval(fetchData, 3000);
+        }
     </script>
 </body>
 </html>
 """
 
 
+# The page has no template variables, so it is minified, compressed and
+# hashed once. Only indentation and blank lines are dropped; keeping the
+# line breaks leaves the inline JS's automatic semicolons intact.
+ROLE_OPTIONS_HTML = "".join(
+    # The table VALID_ROLES is built from, so every option passes validation
+    f'<option value="{role}">{role.replace("_", " ").title()}</option>'
+    for role in AGENT_ROLES
+)
+INDEX_HTML = "\n".join(
+    line.strip()
+    for line in HTML_TEMPLATE.replace("<!--ROLE_OPTIONS-->", ROLE_OPTIONS_HTML).splitlines()
+    if line.strip()
+).encode()
+INDEX_HTML_GZ = gzip.compress(INDEX_HTML, compresslevel=9)
+INDEX_ETAG = hashlib.blake2b(INDEX_HTML, digest_size=16).hexdigest()
+
+
 @app.route("/")
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    if "gzip" in request.accept_encodings:
+        response = app.response_class(INDEX_HTML_GZ, mimetype="text/html")
+        response.content_encoding = "gzip"
+        response.set_etag(INDEX_ETAG + "-gz")
+    else:
+        response = app.response_class(INDEX_HTML, mimetype="text/html")
+        response.set_etag(INDEX_ETAG)
+    response.vary.add("Accept-Encoding")
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
 
 
 @app.route("/api/sessions")
 def get_sessions():
     global state
     if not state:
-        return jsonify([])
-    sessions = state.get_all_sessions()
-    return jsonify(sessions)
+        return json_response([])
+    return conditional_json("sessions", state.get_all_sessions)
+
+
+@app.route("/api/snapshot")
+def get_snapshot():
+    global state
+    if not state:
+        return json_response({"tasks": [], "agents": [], "sessions": []})
+    body, etag = state.get_snapshot_json()
+    response = app.response_class(body, mimetype="application/json")
+    # Polls that find nothing changed get an empty 304
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+@app.route("/api/events")
+def stream_events():
+    """Server-sent events carrying a fresh snapshot whenever data changes
+
+    Each event's id is the snapshot's ETag. A reconnecting browser sends it
+    back as Last-Event-ID, so an unchanged snapshot is not sent again.
+    """
+    last_id = request.headers.get("Last-Event-ID")
+
+    def generate():
+        last = last_id
+        version = changes.version
+        deadline = time.monotonic() + EVENT_STREAM_LIFETIME
+        yield b"retry: %d\n\n" % EVENT_RETRY_MS
+        while True:
+            if state:
+                body, etag = state.get_snapshot_json()
+            else:
+                body = _encode_json({"tasks": [], "agents": [], "sessions": []})
+                etag = "empty"
+            if etag != last:
+                last = etag
+                yield b"id: " + etag.encode() + b"\ndata: " + body + b"\n\n"
+            else:
+                yield b": keepalive\n\n"
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            version = changes.wait(version, min(EVENT_POLL_INTERVAL, remaining))
+
+    return app.response_class(
+        generate(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"}
+    )
 
 
 @app.route("/api/tasks")
 def get_tasks():
     global state
     if not state:
-        return jsonify([])
+        return json_response([])
     session_id = request.args.get("session_id")
-    tasks = state.get_all_tasks(session_id)
-    return jsonify(tasks)
+    return conditional_json(("tasks", session_id), lambda: state.get_all_tasks(session_id))
+
+
+def _task_problem(task: Any) -> Optional[str]:
+    """Why task is not a valid new-task body, or None if it is"""
+    if not isinstance(task, dict):
+        return "must be an object"
+    if not isinstance(task.get("task_id"), str) or not task["task_id"]:
+        return "needs a non-empty string task_id"
+    if task.get("agent_role") and task["agent_role"] not in VALID_ROLES:
+        return f"has unknown agent_role {task['agent_role']!r}"
+    return None
 
 
 @app.route("/api/tasks", methods=["POST"])
 def add_task():
     global state
     if not state:
-        return jsonify({"error": "No state available"}), 400
-
-    data = request.json
-    state.add_task(
+        return json_response({"error": "No state available"}, 400)
+
+    data = request_json()
+    # A list of tasks is inserted in one transaction, once every task checks out
+    if isinstance(data, list):
+        for index, task in enumerate(data):
+            problem = _task_problem(task)
+            if problem:
+                return json_response({"error": f"task {index} {problem}"}, 400)
+        inserted = state.add_tasks(data)
+        changes.notify()
+        return json_response({"success": True, "inserted": inserted})
+
+    problem = _task_problem(data)
+    if problem:
+        return json_response({"error": f"task {problem}"}, 400)
+    inserted = state.add_task(
         task_id=data["task_id"],
         agent_role=data.get("agent_role"),
         description=data.get("description"),
     )
-    return jsonify({"success": True})
+    if not inserted:
+        return json_response({"error": f"task {data['task_id']!r} already exists"}, 409)
+    changes.notify()
+    return json_response({"success": True})
 
 
 @app.route("/api/tasks/<task_id>", methods=["PUT"])
 def update_task(task_id):
     global state
     if not state:
-        return jsonify({"error": "No state available"}), 400
+        return json_response({"error": "No state available"}, 400)
 
-    data = request.json
+    data = request_json()
+    if not isinstance(data, dict):
+        return json_response({"error": "task update must be an object"}, 400)
+    if data.get("agent_role") and data["agent_role"] not in VALID_ROLES:
+        return json_response({"error": f"unknown agent_role {data['agent_role']!r}"}, 400)
     state.update_task(
         task_id=task_id,
         status=data.get("status"),
         agent_role=data.get("agent_role"),
         description=data.get("description"),
     )
-    return jsonify({"success": True})
+    changes.notify()
+    return json_response({"success": True})
 
 
 @app.route("/api/tasks/<task_id>", methods=["DELETE"])
 def delete_task(task_id):
     global state
     if not state:
-        return jsonify({"error": "No state available"}), 400
+        return json_response({"error": "No state available"}, 400)
 
     state.delete_task(task_id)
-    return jsonify({"success": True})
+    changes.notify()
+    return json_response({"success": True})
+
+
+@app.route("/api/tasks/batch_delete", methods=["POST"])
+def delete_tasks():
+    global state
+    if not state:
+        return json_response({"error": "No state available"}, 400)
+
+    task_ids = request_json()
+    if not isinstance(task_ids, list) or not all(isinstance(t, str) for t in task_ids):
+        abort(400)
+    deleted = state.delete_tasks(task_ids)
+    changes.notify()
+    return json_response({"success": True, "deleted": deleted})
 
 
 @app.route("/api/agents")
 def get_agents():
     global state
     if not state:
-        return jsonify([])
+        return json_response([])
     session_id = request.args.get("session_id")
-    agents = state.get_all_agents(session_id)
-    return jsonify(agents)
+    return conditional_json(("agents", session_id), lambda: state.get_all_agents(session_id))
 
 
-def find_available_port(start_port=5000, max_attempts=100):
-    """Find an available port starting from start_port"""
-    for port in range(start_port, start_port + max_attempts):
+@app.route("/api/reports")
+def get_reports():
+    global state
+    if not state:
+        return json_response([])
+    session_id = request.args.get("session_id")
+    return conditional_json(("reports", session_id), lambda: state.get_all_reports(session_id))
+
+
+def find_available_port(preferred: Optional[int] = 5000) -> int:
+    """Return preferred if it is free, otherwise any free port the OS picks
+
+    Binding port 0 lets the kernel choose in one call instead of probing
+    ports one by one.
+    """
+    if preferred:
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(("", port))
-                return port
+                s.bind(("", preferred))
+                return preferred
         except OSError:
-            continue
-    raise RuntimeError(f"Could not find available port after {max_attempts} attempts")
+            pass
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("", 0))
+        return s.getsockname()[1]
+
+
+async def _serve_uvicorn(server, browser_url: Optional[str]):
+    """Run a uvicorn server, opening the browser from the event loop"""
+    if browser_url:
+        asyncio.get_running_loop().call_later(0.5, webbrowser.open, browser_url)
+    await server.serve()
 
 
-def run_web_server(port=None, project_dir=None):
+def default_server() -> str:
+    """waitress when it is installed, else Flask's development server"""
+    return "waitress" if importlib.util.find_spec("waitress") else "flask"
+
+
+def serve(port: int, server: Optional[str] = None, browser_url: Optional[str] = None,
+          dev: bool = False):
+    """Serve app on port with the chosen WSGI/ASGI server
+
+    server defaults to default_server(). waitress and uvicorn are optional;
+    all three run a single process since the project state and change feed
+    live in this one. dev runs Flask's server in debug mode, bound to
+    localhost only since its debugger executes code. browser_url, if
+    given, is opened shortly after the server starts.
+    """
+    if dev:
+        server = "flask"
+    elif server is None:
+        server = default_server()
+
+    if server == "waitress":
+        try:
+            from waitress import serve as waitress_serve
+        except ImportError:
+            print("waitress not installed. Install with: pip install waitress")
+            sys.exit(1)
+    elif server == "uvicorn":
+        try:
+            import uvicorn
+            from a2wsgi import WSGIMiddleware
+        except ImportError:
+            print("uvicorn not installed. Install with: pip install uvicorn a2wsgi")
+            sys.exit(1)
+        # The app runs on a thread pool, as under waitress; a single-threaded
+        # adapter (asgiref's WsgiToAsgi) would stall every request behind
+        # an open event stream. loop="auto" runs on uvloop when installed.
+        config = uvicorn.Config(
+            WSGIMiddleware(app, workers=SERVER_THREADS),
+            host="0.0.0.0",
+            port=port,
+            loop="auto",
+            log_level="warning",
+        )
+        asyncio.run(_serve_uvicorn(uvicorn.Server(config), browser_url))
+        return
+
+    if browser_url:
+        timer = Timer(1.5, webbrowser.open, args=(browser_url,))
+        timer.daemon = True
+        timer.start()
+    if server == "waitress":
+        waitress_serve(app, host="0.0.0.0", port=port, threads=SERVER_THREADS, _quiet=True)
+    else:
+        # The interactive debugger must never be reachable from the network
+        host = "127.0.0.1" if dev else "0.0.0.0"
+        app.run(host=host, port=port, debug=dev, use_reloader=False, threaded=True)
+
+
+def run_web_server(port=None, project_dir=None, server=None, dev=False):
     """Start the web server"""
     global state
 
@@ -984,16 +1327,14 @@ def run_web_server(port=None, project_dir=None):
     print(f"\n🌐 Starting Autonomous Project Web GUI...")
     print(f"📁 Project Directory: {project_dir}")
     print(f"💾 Database: {state.db_path}")
-    print(f"🚀 Server: http://localhost:{port}")
+    if dev:
+        server = "flask"
+    elif server is None:
+        server = default_server()
+    print(f"🚀 Server: http://localhost:{port} ({server}{', debug' if dev else ''})")
     print(f"\n✨ Opening browser...\n")
 
-    def open_browser():
-        time.sleep(1.5)
-        webbrowser.open(f"http://localhost:{port}")
-
-    Thread(target=open_browser, daemon=True).start()
-
-    app.run(host="0.0.0.0", port=port, debug=False)
+    serve(port, server, browser_url=f"http://localhost:{port}", dev=dev)
 
 
 def main():
@@ -1007,11 +1348,22 @@ def main():
     parser.add_argument(
         "--dir", help="Project directory (defaults to current directory)", default="."
     )
+    parser.add_argument(
+        "--server",
+        choices=["flask", "waitress", "uvicorn"],
+        default=None,
+        help="HTTP server to run the GUI with (default: waitress if installed, else flask)",
+    )
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Use Flask's development server in debug mode, listening on localhost only",
+    )
 
     args = parser.parse_args()
 
     if args.web:
-        run_web_server(port=args.port, project_dir=args.dir)
+        run_web_server(port=args.port, project_dir=args.dir, server=args.server, dev=args.dev)
     else:
         print("Use --web to start the web GUI")
         print(f"Example: python3 {Path(__file__).name} --web")
@@ -42,6 +42,7 @@ if [ "$INSTALL_CLAUDE" = true ]; then
     cp "$SCRIPT_DIR/SKILL.md" "$HOME/.claude/skills/autonomous-project/"
     cp "$SCRIPT_DIR/autonomous_project.py" "$HOME/.claude/scripts/"
     cp "$SCRIPT_DIR/autonomous_project_web.py" "$HOME/.claude/scripts/"
+    cp "$SCRIPT_DIR/project_db.py" "$HOME/.claude/scripts/"
     cp "$SCRIPT_DIR/task_sync.py" "$HOME/.claude/scripts/"
     cp "$SCRIPT_DIR/sync_tasks_to_db.py" "$HOME/.claude/scripts/"
     cp "$SCRIPT_DIR/sync_agent_to_db.py" "$HOME/.claude/scripts/"
@@ -61,6 +62,7 @@ if [ "$INSTALL_OPENCODE" = true ]; then
     cp "$SCRIPT_DIR/SKILL.md" "$HOME/.config/opencode/skills/autonomous-project/"
     cp "$SCRIPT_DIR/autonomous_project.py" "$HOME/.config/opencode/skills/autonomous-project/"
     cp "$SCRIPT_DIR/autonomous_project_web.py" "$HOME/.config/opencode/skills/autonomous-project/"
+    cp "$SCRIPT_DIR/project_db.py" "$HOME/.config/opencode/skills/autonomous-project/"
     cp "$SCRIPT_DIR/task_sync.py" "$HOME/.config/opencode/skills/autonomous-project/"
     cp "$SCRIPT_DIR/sync_tasks_to_db.py" "$HOME/.config/opencode/skills/autonomous-project/"
     cp "$SCRIPT_DIR/sync_agent_to_db.py" "$HOME/.config/opencode/skills/autonomous-project/"
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+SQLite plumbing shared by the coordinator, the web GUI and the sync scripts
+
+Only imports the standard library, so short-lived hook invocations such as
+sync_tasks_to_db.py and sync_agent_to_db.py can open the database without
+loading the coordinator.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional
+
+
+# Applied to every connection: WAL lets the web GUI read while the
+# coordinator writes, synchronous=NORMAL is safe under WAL, and a 256 MiB
+# mmap window serves reads from the page cache without copying.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    # Checkpoint every ~4 MB of WAL so the log stays bounded between runs
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+# Room for every statement the coordinator and web GUI keep as constants,
+# without evictions
+SQLITE_CACHED_STATEMENTS = 256
+
+
+def _configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply the shared PRAGMA set to a freshly opened connection"""
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def migrate_reports_table(conn: sqlite3.Connection):
+    """Add the compressed-payload columns to reports tables created without them"""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(reports)")}
+    if "data_z" not in columns:
+        conn.execute("ALTER TABLE reports ADD COLUMN data_z BLOB")
+    if "compressed" not in columns:
+        conn.execute("ALTER TABLE reports ADD COLUMN compressed INTEGER DEFAULT 0")
+
+
+# Stored in PRAGMA user_version once create_schema has run; bump it
+# whenever create_schema gains a table, column or index
+SCHEMA_VERSION = 1
+
+SQL_CREATE_UNIQUE_TASKS = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_tasks_session_task ON tasks(session_id, task_id)"
+)
+
+
+def _merge_duplicate_tasks(conn: sqlite3.Connection) -> int:
+    """Collapse repeated (session_id, task_id) rows into the oldest one
+
+    The kept row takes the status and completed_at of the newest duplicate,
+    the last state a sync recorded. Returns the number of rows removed.
+    """
+    conn.execute("""
+        UPDATE tasks SET
+            status = (SELECT newest.status FROM tasks AS newest
+                      WHERE newest.session_id = tasks.session_id AND newest.task_id = tasks.task_id
+                      ORDER BY newest.id DESC LIMIT 1),
+            completed_at = (SELECT newest.completed_at FROM tasks AS newest
+                            WHERE newest.session_id = tasks.session_id AND newest.task_id = tasks.task_id
+                            ORDER BY newest.id DESC LIMIT 1)
+        WHERE id IN (SELECT MIN(id) FROM tasks GROUP BY session_id, task_id HAVING COUNT(*) > 1)
+    """)
+    return conn.execute("""
+        DELETE FROM tasks
+        WHERE id NOT IN (SELECT MIN(id) FROM tasks GROUP BY session_id, task_id)
+    """).rowcount
+
+
+def create_schema(conn: sqlite3.Connection):
+    """Create the tables and indexes, upgrading older databases in place
+
+    Idempotent, and needs nothing but a connection, so the sync scripts can
+    set up a fresh database without building a ProjectState.
+    """
+    # Sessions table
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id TEXT PRIMARY KEY,
+            created_at TEXT NOT NULL,
+            project_goal TEXT NOT NULL,
+            current_phase TEXT DEFAULT 'initialization'
+        )
+    """)
+
+    # Agents table
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS agents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT NOT NULL,
+            role TEXT NOT NULL,
+            agent_id TEXT,
+            started_at TEXT NOT NULL,
+            status TEXT DEFAULT 'active',
+            FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+        )
+    """)
+
+    # Tasks table
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT NOT NULL,
+            task_id TEXT NOT NULL,
+            agent_role TEXT,
+            description TEXT,
+            status TEXT DEFAULT 'pending',
+            created_at TEXT NOT NULL,
+            completed_at TEXT,
+            FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+        )
+    """)
+
+    # Reports table
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS reports (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            phase TEXT,
+            completed_tasks INTEGER,
+            data TEXT,
+            data_z BLOB,
+            compressed INTEGER DEFAULT 0,
+            FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+        )
+    """)
+    migrate_reports_table(conn)
+
+    # A task id is unique within its session, which lets syncs insert
+    # with OR IGNORE instead of checking for each task first. Older sync
+    # scripts re-inserted tasks on every run; those duplicates are merged
+    # first so the index can always be built.
+    try:
+        conn.execute(SQL_CREATE_UNIQUE_TASKS)
+    except sqlite3.IntegrityError:
+        removed = _merge_duplicate_tasks(conn)
+        print(f"🔧 Merged {removed} duplicate task rows left by older syncs")
+        conn.execute(SQL_CREATE_UNIQUE_TASKS)
+    conn.execute("DROP INDEX IF EXISTS idx_tasks_session_task")
+
+    # Indexes for the per-session lookups done by every phase
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_session_status ON tasks(session_id, status)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_agents_session_status ON agents(session_id, status)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_reports_session_ts ON reports(session_id, timestamp)")
+    # Latest-session lookup done by the task and agent sync scripts. Carrying
+    # session_id makes it a covering index, so the lookup reads one index
+    # entry and never touches the table; it replaces idx_sessions_created.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sessions_created_desc ON sessions(created_at DESC, session_id)"
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_sessions_created")
+    # TaskSync and the web GUI update and delete by task id alone
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_task_id ON tasks(task_id)")
+
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def ensure_schema(conn: sqlite3.Connection):
+    """Run create_schema only if conn's database predates SCHEMA_VERSION
+
+    One PRAGMA read on an up-to-date database, so short-lived callers can
+    check on every start without paying for the DDL.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        create_schema(conn)
+
+
+class ConnectionPool:
+    """One serialised writer connection plus a bounded set of readers
+
+    Under WAL, readers never block the writer (or each other), so SELECTs
+    go through read-only connections while all writes share the single
+    writer guarded by a lock.
+    """
+
+    def __init__(self, db_path: Path, max_readers: Optional[int] = None):
+        self.db_path = Path(db_path).resolve()
+        self._write_lock = threading.RLock()
+        self._writer = _configure_connection(
+            sqlite3.connect(
+                self.db_path,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=SQLITE_CACHED_STATEMENTS,
+            )
+        )
+        self._reader_slots = threading.BoundedSemaphore(max_readers or min(8, os.cpu_count() or 1))
+        self._idle_readers = queue.SimpleQueue()
+        # change_token never touches the writer or its lock, so a read is
+        # never stuck behind an open write transaction
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+        self._version_conn = self._open_reader()
+        self._version_lock = threading.Lock()
+
+    def _open_reader(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            f"{self.db_path.as_uri()}?mode=ro",
+            uri=True,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=SQLITE_CACHED_STATEMENTS,
+        )
+        _configure_connection(conn)
+        conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @contextmanager
+    def acquire_read(self):
+        """Check out a read-only connection, opening one if none is idle"""
+        with self._reader_slots:
+            try:
+                conn = self._idle_readers.get_nowait()
+            except queue.Empty:
+                conn = self._open_reader()
+            try:
+                yield conn
+            finally:
+                self._idle_readers.put(conn)
+
+    @contextmanager
+    def acquire_write(self):
+        """Hold the writer connection exclusively for the block"""
+        with self._write_lock:
+            try:
+                yield self._writer
+            finally:
+                with self._writes_lock:
+                    self._writes += 1
+
+    def change_token(self) -> tuple:
+        """Cheap value that differs whenever the database may have changed
+
+        Combines a count of writes made through this pool with data_version
+        read on a dedicated connection, which moves when any other
+        connection or process commits, so callers can cache query results
+        between changes.
+        """
+        with self._writes_lock:
+            writes = self._writes
+        with self._version_lock:
+            data_version = self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+        return (writes, data_version)
+
+    def close(self):
+        """Close the writer and every idle reader"""
+        with self._write_lock:
+            if self._writer is None:
+                return
+            # Refresh planner statistics for the next run
+            self._writer.execute("PRAGMA optimize")
+            self._writer.close()
+            self._writer = None
+        with self._version_lock:
+            self._version_conn.close()
+        while True:
+            try:
+                self._idle_readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class WriteQueue:
+    """Group commit for writes submitted from many threads
+
+    A single background thread drains up to BATCH_SIZE queued writes at a
+    time and runs them in one BEGIN IMMEDIATE transaction on the pool's
+    writer. Each write gets its own savepoint, so one failing write is
+    rolled back and reported to its caller without sinking the batch.
+    """
+
+    BATCH_SIZE = 32
+    # Longest a caller waits for its batch; a batch can spend several
+    # busy_timeout waits behind another process's write lock
+    TIMEOUT = 30.0
+
+    def __init__(self, pool: ConnectionPool):
+        self.pool = pool
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, op, wait: bool = True):
+        """Queue op(cursor) for the next batch
+
+        With wait (the default), blocks until the batch has committed and
+        returns op's result, re-raising anything op raised. Raises
+        sqlite3.OperationalError if the writer thread is gone or the batch
+        does not finish within TIMEOUT seconds.
+        """
+        if not self._thread.is_alive():
+            raise sqlite3.OperationalError("database writer thread is not running")
+        write = {"op": op, "done": threading.Event(), "result": None, "error": None}
+        self._queue.put(write)
+        if not wait:
+            return None
+        deadline = time.monotonic() + self.TIMEOUT
+        # Waits in short slices so a writer thread that dies is noticed
+        while not write["done"].wait(0.1):
+            if not self._thread.is_alive():
+                raise sqlite3.OperationalError("database writer thread stopped")
+            if time.monotonic() > deadline:
+                raise sqlite3.OperationalError(f"database write did not finish in {self.TIMEOUT:g}s")
+        if write["error"] is not None:
+            raise write["error"]
+        return write["result"]
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._apply(batch)
+            except Exception as e:
+                # BEGIN or COMMIT failed, so none of the batch was saved
+                for write in batch:
+                    write["error"] = write["error"] or e
+            for write in batch:
+                write["done"].set()
+
+    def _apply(self, batch: List[dict]):
+        with self.pool.acquire_write() as conn:
+            if conn is None:
+                raise sqlite3.OperationalError("connection pool is closed")
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                for write in batch:
+                    cursor.execute("SAVEPOINT queued_write")
+                    try:
+                        write["result"] = write["op"](cursor)
+                    except Exception as e:
+                        cursor.execute("ROLLBACK TO queued_write")
+                        write["error"] = e
+                    cursor.execute("RELEASE queued_write")
+                cursor.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    cursor.execute("ROLLBACK")
+                raise
@@ -13,8 +13,45 @@ Usage:
 
 import sys
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
+from typing import Dict
+
+from project_db import _configure_connection
+
+
+# Latest session id per database, for callers syncing several agents in
+# one process; sessions this module creates are recorded here as well
+_session_ids: Dict[Path, str] = {}
+
+# INSERT ... RETURNING needs SQLite 3.35
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+@contextmanager
+def _db(db_path: Path, write: bool = True):
+    """
+    Open the database with the shared PRAGMAs and yield a cursor
+
+    Writes run as one BEGIN IMMEDIATE transaction, committed when the block
+    exits or rolled back if it raises. The connection is closed either way.
+    """
+    conn = _configure_connection(sqlite3.connect(db_path, isolation_level=None))
+    try:
+        cursor = conn.cursor()
+        if not write:
+            yield cursor
+            return
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield cursor
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
 
 
 def sync_agent(
@@ -37,36 +74,52 @@ def sync_agent(
         print("   Run the autonomous project first to initialize the database.")
         return False
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    if not session_id:
-        cursor.execute("SELECT session_id FROM sessions ORDER BY created_at DESC LIMIT 1")
-        result = cursor.fetchone()
-        if result:
-            session_id = result[0]
-        else:
-            session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    started = datetime.now()
+    started_at = started.isoformat()
+    # The session lookup, any new session and the agent commit together
+    with _db(db_path) as cursor:
+        inserted = False
+        if not session_id:
+            session_id = _session_ids.get(db_path)
+        if not session_id and HAS_RETURNING:
+            # Find the latest session and add the agent to it in one statement
             cursor.execute(
                 """
-                INSERT INTO sessions (session_id, created_at, project_goal, current_phase)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO agents (session_id, role, agent_id, started_at, status)
+                SELECT session_id, ?, ?, ?, ? FROM sessions ORDER BY created_at DESC LIMIT 1
+                RETURNING session_id
             """,
-                (session_id, datetime.now().isoformat(), "Autonomous Project", "implementation"),
+                (role, agent_id, started_at, status),
+            )
+            result = cursor.fetchone()
+            if result:
+                session_id = _session_ids[db_path] = result[0]
+                inserted = True
+        if not session_id:
+            cursor.execute("SELECT session_id FROM sessions ORDER BY created_at DESC LIMIT 1")
+            result = cursor.fetchone()
+            if result:
+                session_id = result[0]
+            else:
+                session_id = started.strftime("%Y%m%d_%H%M%S")
+                cursor.execute(
+                    """
+                    INSERT INTO sessions (session_id, created_at, project_goal, current_phase)
+                    VALUES (?, ?, ?, ?)
+                """,
+                    (session_id, started_at, "Autonomous Project", "implementation"),
+                )
+                print(f"📝 Created new session: {session_id}")
+            _session_ids[db_path] = session_id
+
+        if not inserted:
+            cursor.execute(
+                """
+                INSERT INTO agents (session_id, role, agent_id, started_at, status)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                (session_id, role, agent_id, started_at, status),
             )
-            conn.commit()
-            print(f"📝 Created new session: {session_id}")
-
-    cursor.execute(
-        """
-        INSERT INTO agents (session_id, role, agent_id, started_at, status)
-        VALUES (?, ?, ?, ?, ?)
-    """,
-        (session_id, role, agent_id, datetime.now().isoformat(), status),
-    )
-
-    conn.commit()
-    conn.close()
 
     print(f"✅ Synced agent to SQLite: {role} ({agent_id}) [{status}]")
     return True
@@ -80,23 +133,20 @@ def update_agent_status(project_dir: Path, agent_id: str, status: str):
         print(f"❌ Error: Database not found at {db_path}")
         return False
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute(
-        """
-        UPDATE agents SET status = ? WHERE agent_id = ?
-    """,
-        (status, agent_id),
-    )
+    with _db(db_path) as cursor:
+        cursor.execute(
+            """
+            UPDATE agents SET status = ? WHERE agent_id = ?
+        """,
+            (status, agent_id),
+        )
+        updated = cursor.rowcount
 
-    if cursor.rowcount > 0:
-        conn.commit()
+    if updated > 0:
         print(f"✅ Updated agent status: {agent_id} → {status}")
     else:
         print(f"⚠️  Agent not found: {agent_id}")
 
-    conn.close()
     return True
 
 
@@ -108,15 +158,11 @@ def list_agents(project_dir: Path):
         print(f"❌ Error: Database not found at {db_path}")
         return
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT agent_id, role, status, started_at FROM agents ORDER BY started_at DESC
-    """)
-
-    agents = cursor.fetchall()
-    conn.close()
+    with _db(db_path, write=False) as cursor:
+        cursor.execute("""
+            SELECT agent_id, role, status, started_at FROM agents ORDER BY started_at DESC
+        """)
+        agents = cursor.fetchall()
 
     if not agents:
         print("No agents found in database.")
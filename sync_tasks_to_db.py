@@ -32,7 +32,7 @@ def sync_from_json(project_dir: Path, tasks_json: str):
             print(f"❌ Error: Expected array of tasks, got {type(tasks)}")
             return
 
-        synced_count = 0
+        rows = []
         for task in tasks:
             task_id = task.get('id') or task.get('task_id')
             description = task.get('description') or task.get('subject', 'No description')
@@ -40,10 +40,10 @@ def sync_from_json(project_dir: Path, tasks_json: str):
             agent_role = task.get('agent_role') or task.get('owner')
 
             if task_id:
-                sync.create_task(str(task_id), description, agent_role)
-                if status != 'pending':
-                    sync.update_task(str(task_id), status=status)
-                synced_count += 1
+                rows.append((str(task_id), description, agent_role, status))
+
+        # One transaction for the whole list rather than a commit per task
+        synced_count = sync.batch_upsert(rows)
 
         print(f"\n✅ Synced {synced_count} tasks to SQLite database")
         print(f"📁 Database: {sync.db_path}")
@@ -9,26 +9,126 @@ Usage:
     from task_sync import sync_create_task, sync_update_task
 """
 
+import atexit
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
+
+from project_db import ConnectionPool, _configure_connection, ensure_schema
+
+
+# One fixed statement for every combination of fields, so sqlite3's
+# statement cache reuses a single prepared plan
+SQL_UPDATE_TASK = """
+    UPDATE tasks SET
+        status = COALESCE(?1, status),
+        agent_role = COALESCE(?2, agent_role),
+        description = COALESCE(?3, description),
+        completed_at = CASE WHEN ?1 = 'completed' THEN ?4 ELSE completed_at END
+    WHERE task_id = ?5
+"""
 
 
 class TaskSync:
     """Synchronizes tasks between Claude Code and SQLite database"""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, pool: Optional[ConnectionPool] = None):
         self.project_dir = Path(project_dir)
         self.db_path = self.project_dir / ".autonomous_project.db"
-        self._ensure_db()
-
-    def _ensure_db(self):
-        """Ensure database exists with proper schema"""
-        if not self.db_path.exists():
-            # Initialize database if it doesn't exist
-            from autonomous_project import ProjectState
-            state = ProjectState(self.project_dir)
+        # The schema is only checked once a connection is first needed, so
+        # constructing a TaskSync that never writes costs nothing
+        self._initialized = False
+
+        # In-process callers pass the coordinator's pool, so writes share its
+        # single writer instead of contending with it from another connection
+        self.pool = pool
+
+        # Latest session id, looked up once; the coordinator creates its
+        # session before syncing any tasks into it
+        self._session_id: Optional[str] = None
+
+        # Otherwise, one autocommit connection per thread, opened on first use
+        self._local = threading.local()
+        self._conns = []
+        self._conns_lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening and tuning it if needed"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            with self._conns_lock:
+                conn = _configure_connection(
+                    sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+                )
+                self._lazy_init(conn)
+                self._conns.append(conn)
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _reader(self):
+        """Connection for a read: a pooled reader, or this thread's connection"""
+        if self.pool is not None:
+            with self.pool.acquire_read() as conn:
+                yield conn
+        else:
+            yield self._conn()
+
+    @contextmanager
+    def _writer(self):
+        """Connection for a write: the pool's writer, or this thread's connection"""
+        if self.pool is not None:
+            with self.pool.acquire_write() as conn:
+                yield conn
+        else:
+            yield self._conn()
+
+    @contextmanager
+    def _transaction(self):
+        """Cursor on the write connection inside one BEGIN IMMEDIATE transaction"""
+        with self._writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        """Close every connection this instance opened"""
+        with self._conns_lock:
+            if self._conns:
+                # Refresh planner statistics, as ConnectionPool.close does
+                self._conns[0].execute("PRAGMA optimize")
+            for conn in self._conns:
+                conn.close()
+            self._conns.clear()
+        self._local = threading.local()
+
+    def _lazy_init(self, conn: sqlite3.Connection):
+        """Ensure conn's database has the current schema, once per instance"""
+        if self._initialized:
+            return
+        # Creates a new database, or upgrades one from an older version
+        # (e.g. the task_id index update_task and delete_task rely on); an
+        # up-to-date schema costs a single PRAGMA read
+        ensure_schema(conn)
+        self._initialized = True
+
+    def _latest_session_id(self, conn: sqlite3.Connection) -> Optional[str]:
+        """The most recent session id, cached after the first lookup finds one"""
+        if self._session_id is None:
+            result = conn.execute(
+                "SELECT session_id FROM sessions ORDER BY created_at DESC LIMIT 1"
+            ).fetchone()
+            self._session_id = result[0] if result else None
+        return self._session_id
 
     def create_task(self, task_id: str, description: str, agent_role: Optional[str] = None, session_id: Optional[str] = None):
         """
@@ -39,26 +139,26 @@ class TaskSync:
             description: Task description
             agent_role: Assigned agent role (planner, builder, etc.)
             session_id: Session ID (auto-detected if None)
-        """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Get latest session if not provided
-        if not session_id:
-            cursor.execute("SELECT session_id FROM sessions ORDER BY created_at DESC LIMIT 1")
-            result = cursor.fetchone()
-            session_id = result[0] if result else datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        # Insert task
-        cursor.execute("""
-            INSERT INTO tasks (session_id, task_id, agent_role, description, status, created_at)
-            VALUES (?, ?, ?, ?, 'pending', ?)
-        """, (session_id, task_id, agent_role, description, datetime.now().isoformat()))
 
-        conn.commit()
-        conn.close()
-
-        print(f"✅ Synced task to SQLite: {task_id}")
+        Returns:
+            False if the session already had a task with this id
+        """
+        with self._writer() as conn:
+            # Get latest session if not provided
+            if not session_id:
+                session_id = self._latest_session_id(conn) or datetime.now().strftime("%Y%m%d_%H%M%S")
+
+            # Insert task, leaving an existing task with the same id untouched
+            inserted = conn.execute("""
+                INSERT OR IGNORE INTO tasks (session_id, task_id, agent_role, description, status, created_at)
+                VALUES (?, ?, ?, ?, 'pending', ?)
+            """, (session_id, task_id, agent_role, description, datetime.now().isoformat())).rowcount
+
+        if inserted:
+            print(f"✅ Synced task to SQLite: {task_id}")
+        else:
+            print(f"⚠️  Task already in SQLite, left unchanged: {task_id}")
+        return bool(inserted)
 
     def update_task(self, task_id: str, status: Optional[str] = None, agent_role: Optional[str] = None, description: Optional[str] = None):
         """
@@ -70,63 +170,102 @@ class TaskSync:
             agent_role: New agent role
             description: New description
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        updates = []
-        params = []
-
-        if status:
-            updates.append("status = ?")
-            params.append(status)
-            if status == "completed":
-                updates.append("completed_at = ?")
-                params.append(datetime.now().isoformat())
-
-        if agent_role:
-            updates.append("agent_role = ?")
-            params.append(agent_role)
-
-        if description:
-            updates.append("description = ?")
-            params.append(description)
-
-        if updates:
-            params.append(task_id)
-            query = f"UPDATE tasks SET {', '.join(updates)} WHERE task_id = ?"
-            cursor.execute(query, params)
-            conn.commit()
+        # Empty values leave their column as it is
+        params = (status or None, agent_role or None, description or None)
+        if any(params):
+            with self._writer() as conn:
+                completed_at = datetime.now().isoformat() if status == "completed" else None
+                conn.execute(SQL_UPDATE_TASK, (*params, completed_at, task_id))
             print(f"✅ Synced task update to SQLite: {task_id} → {status or 'updated'}")
 
-        conn.close()
+    def batch_upsert(self, tasks: List[Tuple[str, str, Optional[str], str]]) -> int:
+        """
+        Create or update many tasks in a single transaction
+
+        Args:
+            tasks: (task_id, description, agent_role, status) tuples. New ids are
+                inserted into the latest session already carrying their status;
+                existing tasks get any status other than pending applied as
+                update_task would.
+
+        Returns:
+            Number of tasks synced
+        """
+        # One clock read stamps every row in the batch
+        started = datetime.now()
+        now = started.isoformat()
+        with self._transaction() as cursor:
+            session_id = self._latest_session_id(cursor.connection) or started.strftime("%Y%m%d_%H%M%S")
+
+            cursor.executemany("""
+                INSERT OR IGNORE INTO tasks
+                    (session_id, task_id, agent_role, description, status, created_at, completed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (session_id, task_id, agent_role, description, status or "pending", now,
+                 now if status == "completed" else None)
+                for task_id, description, agent_role, status in tasks
+            ])
+            # Rows just inserted already match, so this only writes tasks
+            # that existed with a different status
+            cursor.executemany("""
+                UPDATE tasks SET status = ?, completed_at = COALESCE(?, completed_at)
+                WHERE task_id = ? AND status IS NOT ?
+            """, [
+                (status, now if status == "completed" else None, task_id, status)
+                for task_id, _, _, status in tasks
+                if status and status != "pending"
+            ])
+
+        return len(tasks)
+
+    def batch_update_status(self, pairs: List[Tuple[str, str]]) -> int:
+        """
+        Set the status of many tasks in a single transaction
+
+        Args:
+            pairs: (task_id, status) tuples, applied as update_task would
+
+        Returns:
+            Number of rows updated
+        """
+        now = datetime.now().isoformat() if any(status == "completed" for _, status in pairs) else None
+        with self._transaction() as cursor:
+            cursor.executemany(SQL_UPDATE_TASK, [
+                (status, None, None, now, task_id) for task_id, status in pairs if status
+            ])
+            updated = cursor.rowcount
+        print(f"✅ Synced {updated} task status update(s) to SQLite")
+        return updated
+
+    def batch_delete(self, task_ids: List[str]) -> int:
+        """Delete many tasks in a single transaction, returning the rows removed"""
+        with self._transaction() as cursor:
+            cursor.executemany("DELETE FROM tasks WHERE task_id = ?", [(task_id,) for task_id in task_ids])
+            deleted = cursor.rowcount
+        print(f"✅ Deleted {deleted} task(s) from SQLite")
+        return deleted
 
     def delete_task(self, task_id: str):
         """Delete task from SQLite database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
-        conn.commit()
-        conn.close()
+        with self._writer() as conn:
+            conn.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
         print(f"✅ Deleted task from SQLite: {task_id}")
 
     def get_session_id(self) -> Optional[str]:
         """Get the most recent session ID"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT session_id FROM sessions ORDER BY created_at DESC LIMIT 1")
-        result = cursor.fetchone()
-        conn.close()
-        return result[0] if result else None
+        with self._reader() as conn:
+            return self._latest_session_id(conn)
 
 
 # Global instance (will be set by coordinator)
 _sync_instance: Optional[TaskSync] = None
 
 
-def init_sync(project_dir: Path):
-    """Initialize the sync instance"""
+def init_sync(project_dir: Path, pool: Optional[ConnectionPool] = None):
+    """Initialize the sync instance, optionally sharing an existing pool"""
     global _sync_instance
-    _sync_instance = TaskSync(project_dir)
+    _sync_instance = TaskSync(project_dir, pool=pool)
     return _sync_instance
 
 